@@ -15,6 +15,10 @@ if __name__ == "__main__":
         print(f"Erro: O arquivo '{ARQUIVO_LABIRINTO}' não foi encontrado.")
     else:
         ambiente = Ambiente(ARQUIVO_LABIRINTO)
+        if not ambiente.solucionavel:
+            # Sem solução, o agente andaria para sempre
+            print("Erro: O labirinto não tem solução; a simulação não será executada.")
+            raise SystemExit(1)
         agente = Agente(ambiente, ambiente.total_comidas)
 
         # 3. Inicia a simulação
@@ -6,7 +6,7 @@ class Agente:
     O agente que explora o labirinto. Possui sensores, atuadores,
     memória e uma estratégia de decisão.
     """
-    def __init__(self, ambiente, total_comidas):
+    def __init__(self, ambiente, total_comidas, registrar_historico=True):
         self.ambiente = ambiente
         self.x, self.y = self.ambiente.posicao_agente
         self.direcao = 'S'  # 'N', 'S', 'L', 'O'
@@ -16,7 +16,9 @@ class Agente:
         self.passos = 0
 
         self.memoria = {}
-        self.historico_posicoes = [(self.x, self.y)] # Para gerar o vídeo
+        # Para gerar o vídeo; execuções sem vídeo desligam para não crescer a cada passo
+        self.registrar_historico = registrar_historico
+        self.historico_posicoes = [(self.x, self.y)] if registrar_historico else []
         self.contagem_visitas = {}
 
     # --- SENSOR ---
@@ -65,15 +67,19 @@ class Agente:
         celula_alvo = self.memoria.get((futuro_x, futuro_y), 'desconhecido')
         
         if celula_alvo != 'X':
-            x_antigo, y_antigo = self.x, self.y
+            # Atualiza o ambiente com a nova posição; ele recusa o movimento se
+            # uma parede fechou ali depois que o agente a viu
+            if not self.ambiente.mover_agente(self.x, self.y, futuro_x, futuro_y, self.direcao):
+                self.memoria[(futuro_x, futuro_y)] = 'X'
+                return False
+
             self.x, self.y = futuro_x, futuro_y
             self.contagem_visitas[(self.x, self.y)] = self.contagem_visitas.get((self.x, self.y), 0) + 1
             
             self.passos += 1
             
-            # Atualiza o ambiente com a nova posição
-            self.ambiente.mover_agente(x_antigo, y_antigo, self.x, self.y, self.direcao)
-            self.historico_posicoes.append((self.x, self.y)) # Guarda para o vídeo
+            if self.registrar_historico:
+                self.historico_posicoes.append((self.x, self.y)) # Guarda para o vídeo
             
             # Verifica se há comida na nova posição
             if self.memoria.get((self.x, self.y)) == 'o':
@@ -148,6 +154,32 @@ class Agente:
         self.setDirection(melhor_direcao)
         self.move()
         
+    def executar_ciclo(self, exibir=False):
+        """
+        Um ciclo de percepção e ação. Retorna True quando o objetivo foi
+        alcançado (todas as comidas coletadas e o agente na saída).
+        """
+        # 0. O ambiente avança um ciclo (labirintos dinâmicos podem mudar)
+        self.ambiente.atualizar()
+
+        # 1. SENSOR: Perceber o ambiente e atualizar a memória
+        visao_atual = self.getSensor()
+
+        if exibir:
+            # Imprime o estado atual
+            print(self.ambiente)
+            print(f"Posição: ({self.x}, {self.y}) | Direção: {self.direcao}")
+            print(f"Passos: {self.passos} | Comidas: {self.comidas_coletadas}/{self.total_comidas_no_mapa}")
+
+        # Condição de parada
+        if self.comidas_coletadas == self.total_comidas_no_mapa and \
+           self.memoria.get((self.x, self.y)) == 'S':
+            return True
+
+        # 2. DECISÃO: Escolher a próxima ação
+        self._decidir_proxima_acao(visao_atual)
+        return False
+
     def executar(self):
         """
         Ciclo de vida principal do agente: percebe, decide e atua.
@@ -156,24 +188,11 @@ class Agente:
         while True:
             # Limpa a tela para uma visualização mais limpa no terminal
             os.system('cls' if os.name == 'nt' else 'clear')
-            
-            # 1. SENSOR: Perceber o ambiente e atualizar a memória
-            visao_atual = self.getSensor()
-            
-            # Imprime o estado atual
-            print(self.ambiente)
-            print(f"Posição: ({self.x}, {self.y}) | Direção: {self.direcao}")
-            print(f"Passos: {self.passos} | Comidas: {self.comidas_coletadas}/{self.total_comidas_no_mapa}")
 
-            # Condição de parada
-            if self.comidas_coletadas == self.total_comidas_no_mapa and \
-               self.memoria.get((self.x, self.y)) == 'S':
+            if self.executar_ciclo(exibir=True):
                 print("\nObjetivo alcançado! Todas as comidas foram coletadas e o agente chegou à saída.")
                 break
-            
-            # 2. DECISÃO: Escolher a próxima ação
-            self._decidir_proxima_acao(visao_atual)
-            
+
             # Pausa para visualização
             time.sleep(0.1)
 
@@ -182,4 +201,7 @@ class Agente:
         print("\n--- Simulação Finalizada ---")
         print(f"Total de comidas coletadas: {self.comidas_coletadas}")
         print(f"Total de passos dados: {self.passos}")
-        print(f"Pontuação Final: ({self.comidas_coletadas} * 10) - {self.passos} = {pontuacao} pontos")
\ No newline at end of file
+        print(f"Pontuação Final: ({self.comidas_coletadas} * 10) - {self.passos} = {pontuacao} pontos")
+        if self.ambiente.pontuacao_otima is not None:
+            limite = "" if self.ambiente.passos_minimos_exato else "no máximo "
+            print(f"Melhor pontuação possível neste labirinto: {limite}{self.ambiente.pontuacao_otima} pontos")
\ No newline at end of file
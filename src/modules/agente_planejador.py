@@ -0,0 +1,138 @@
+from modules.agente import Agente
+from modules.planejador import PlanejadorDStarLite
+
+
+class AgentePlanejador(Agente):
+    """
+    Agente que planeja com D* Lite sobre a própria memória. Células ainda não
+    vistas são tratadas como livres e como objetivos (exploração otimista).
+    Quando o sensor revela uma mudança (parede que abriu/fechou, comida que
+    reapareceu), o plano existente é reparado em vez de refeito.
+    """
+    def __init__(self, ambiente, total_comidas, registrar_historico=True):
+        super().__init__(ambiente, total_comidas, registrar_historico)
+        self.celulas_alteradas = set()
+        self.buscando_saida = False
+        self.saida_vista = False
+        self.explorando = True  # Células desconhecidas são objetivos?
+        self.planejador = self._novo_planejador()
+
+    def _novo_planejador(self):
+        return PlanejadorDStarLite(self.ambiente.largura, self.ambiente.altura,
+                                   self._celula_livre, self._celula_objetivo, (self.x, self.y))
+
+    # --- REGRAS DE TERRENO PARA O PLANEJADOR ---
+    def _celula_livre(self, x, y):
+        celula = self.memoria.get((x, y))
+        if celula == 'X':
+            return False
+        # 'S' é tratado como parede enquanto ainda houver comida a coletar.
+        if celula == 'S' and not self.buscando_saida:
+            return False
+        return True
+
+    def _celula_objetivo(self, x, y):
+        celula = self.memoria.get((x, y))
+        if celula is None:
+            # Célula desconhecida: vale a pena explorar, exceto quando só
+            # falta chegar a uma saída já vista
+            return self.explorando
+        if self.buscando_saida:
+            return celula == 'S'
+        return celula == 'o'
+
+    # --- SENSOR ---
+    def getSensor(self):
+        """
+        Diferente do Agente base, a memória é sobrescrita a cada leitura, para
+        que mudanças do ambiente sejam percebidas e repassadas ao planejador.
+        """
+        visao = self.ambiente.get_sensor_info(self.x, self.y)
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                posicao = (self.x + j, self.y + i)
+                if i == 0 and j == 0:
+                    # O centro mostra a direção do agente, não o terreno.
+                    if posicao not in self.memoria:
+                        self.memoria[posicao] = '_'
+                        self.celulas_alteradas.add(posicao)
+                    continue
+                if self.memoria.get(posicao) != visao[i + 1][j + 1]:
+                    self.memoria[posicao] = visao[i + 1][j + 1]
+                    self.celulas_alteradas.add(posicao)
+                    if visao[i + 1][j + 1] == 'S':
+                        self.saida_vista = True
+        return visao
+
+    # --- ATUADORES ---
+    def move(self):
+        movido = super().move()
+        if movido:
+            # A comida da nova posição pode ter sido consumida
+            self.celulas_alteradas.add((self.x, self.y))
+        return movido
+
+    def _esquecer_paredes_da_regiao(self):
+        """
+        Chamado quando nenhum objetivo é alcançável. Só as paredes internas
+        que cercam a região alcançável podem abrir um caminho novo: elas
+        voltam a ser desconhecidas (e livres, para o planejador) para serem
+        reverificadas. A busca percorre a região do agente, mas só essas
+        paredes são repassadas ao planejador.
+        """
+        inicio = (self.x, self.y)
+        regiao = {inicio}
+        pendentes = [inicio]
+        esquecer = set()
+        while pendentes:
+            x, y = pendentes.pop()
+            for dx, dy in ((0, -1), (0, 1), (1, 0), (-1, 0)):
+                vizinho = (x + dx, y + dy)
+                if vizinho in regiao or vizinho in esquecer:
+                    continue
+                celula = self.memoria.get(vizinho)
+                if celula == 'X':
+                    # A borda externa do mapa nunca muda
+                    if 0 < vizinho[0] < self.ambiente.largura - 1 and \
+                            0 < vizinho[1] < self.ambiente.altura - 1:
+                        esquecer.add(vizinho)
+                elif celula is not None and self._celula_livre(*vizinho):
+                    # Só células conhecidas: desconhecidas já são reverificadas
+                    regiao.add(vizinho)
+                    pendentes.append(vizinho)
+
+        for posicao in esquecer:
+            del self.memoria[posicao]
+        self.celulas_alteradas.update(esquecer)
+
+    def _decidir_proxima_acao(self, visao):
+        """
+        Repara o plano com as células alteradas desde o último ciclo e dá um
+        passo em direção ao objetivo mais próximo.
+        """
+        frente = {(0, -1): 'N', (0, 1): 'S', (1, 0): 'L', (-1, 0): 'O'}
+
+        self.total_comidas_no_mapa = self.ambiente.total_comidas
+        buscando_saida = self.comidas_coletadas >= self.total_comidas_no_mapa
+        explorando = not (buscando_saida and self.saida_vista)
+        if (buscando_saida, explorando) != (self.buscando_saida, self.explorando):
+            # Os objetivos mudaram no mapa todo (inclusive o valor implícito das
+            # células desconhecidas): replanejamento completo, que só acontece
+            # quando a fase muda ou a saída é vista pela primeira vez.
+            self.buscando_saida = buscando_saida
+            self.explorando = explorando
+            self.planejador = self._novo_planejador()
+            self.celulas_alteradas.update(self.memoria)
+
+        self.planejador.atualizar_celulas(self.celulas_alteradas)
+        self.celulas_alteradas.clear()
+        self.planejador.mover_inicio((self.x, self.y))
+
+        proxima = self.planejador.proximo_passo()
+        if proxima is None:
+            if not self.planejador.objetivo(self.x, self.y):
+                self._esquecer_paredes_da_regiao()
+            return  # O próximo ciclo replaneja com as células esquecidas
+
+        self.setDirection(frente[(proxima[0] - self.x, proxima[1] - self.y)])
+        self.move()
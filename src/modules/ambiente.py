@@ -1,3 +1,6 @@
+from modules.analise import analisar_labirinto
+
+
 class Ambiente:
     """
     Representa o labirinto. Carrega o mapa de um arquivo e fornece
@@ -7,9 +10,12 @@ class Ambiente:
         self.mapa = self._carregar_mapa(arquivo_path)
         self.altura = len(self.mapa)
         self.largura = len(self.mapa[0])
+        self.posicao_saida = self._encontrar_saida()
         self.posicao_agente = self._encontrar_posicao_inicial()
         self.total_comidas = self._contar_comidas()
         print(f"Ambiente criado. Tamanho: {self.largura}x{self.altura}. Comidas: {self.total_comidas}.")
+        self._registrar_analise(analisar_labirinto(self.mapa, self.largura, self.altura,
+                                                   self.posicao_agente, self.posicao_saida))
 
     def _carregar_mapa(self, arquivo_path):
         """Carrega o labirinto de um arquivo TXT para uma matriz de caracteres."""
@@ -17,6 +23,14 @@ class Ambiente:
             # strip() remove espaços em branco e quebras de linha no início/fim
             return [list(line.strip()) for line in f.readlines()]
 
+    def _encontrar_saida(self):
+        """Encontra a posição da saída ('S') antes que o agente seja colocado no mapa."""
+        for y, linha in enumerate(self.mapa):
+            for x, celula in enumerate(linha):
+                if celula == 'S':
+                    return [x, y]
+        return None # Retorna None se a saída 'S' não for encontrada
+
     def _encontrar_posicao_inicial(self):
         """Encontra a posição inicial do agente ('E') no mapa."""
         for y, linha in enumerate(self.mapa):
@@ -35,6 +49,27 @@ class Ambiente:
             count += linha.count('o')
         return count
 
+    def _registrar_analise(self, analise):
+        """Guarda o resultado da análise de alcance e avisa se o labirinto não tem solução."""
+        self.comidas_inalcancaveis = analise['comidas_inalcancaveis']
+        self.saida_alcancavel = analise['saida_alcancavel']
+        self.solucionavel = analise['solucionavel']
+        self.passos_minimos = analise['passos_minimos']
+        self.passos_minimos_exato = analise['passos_minimos_exato']
+        self.pontuacao_otima = analise['pontuacao_otima']
+
+        if self.solucionavel:
+            if self.passos_minimos_exato:
+                print(f"Melhor pontuação possível: {self.pontuacao_otima} ({self.passos_minimos} passos).")
+            else:
+                print(f"Melhor pontuação possível: no máximo {self.pontuacao_otima} "
+                      f"(pelo menos {self.passos_minimos} passos).")
+        else:
+            if self.comidas_inalcancaveis:
+                print(f"AVISO: Comidas inalcançáveis a partir da entrada: {self.comidas_inalcancaveis}")
+            if not self.saida_alcancavel:
+                print("AVISO: A saída 'S' não é alcançável a partir da entrada.")
+
     def get_sensor_info(self, x, y):
         """
         Retorna uma matriz 3x3 da visão do agente.
@@ -57,19 +92,37 @@ class Ambiente:
         return matriz_visao
 
     def mover_agente(self, x_antigo, y_antigo, x_novo, y_novo, direcao_agente):
-        """Atualiza a posição do agente no mapa."""
-        # Se o agente saiu da posição de uma comida, ela é consumida (vira corredor)
-        if self.mapa[y_antigo][x_antigo] not in ['E', 'S']:
-             self.mapa[y_antigo][x_antigo] = '_'
+        """
+        Atualiza a posição do agente no mapa. Retorna False, sem alterar nada,
+        se o destino for uma parede (que pode ter fechado depois de ser vista).
+        """
+        if self.mapa[y_novo][x_novo] == 'X':
+            return False
+
+        # Se o agente saiu da posição de uma comida, ela é consumida (vira corredor).
+        # A saída é restaurada pela posição, pois o caractere 'S' também indica
+        # o agente virado para o Sul.
+        if [x_antigo, y_antigo] == self.posicao_saida:
+            self.mapa[y_antigo][x_antigo] = 'S'
+        else:
+            self.mapa[y_antigo][x_antigo] = '_'
         
         self.mapa[y_novo][x_novo] = direcao_agente
         self.posicao_agente = [x_novo, y_novo]
+        return True
 
     def consumir_comida(self, x, y):
         """Marca uma comida como consumida (transforma em corredor)."""
         # A lógica de mover o agente já faz isso, mas podemos ter uma função explícita
         self.mapa[y][x] = '_'
 
+    def atualizar(self):
+        """
+        Avança o relógio do ambiente em um ciclo e retorna as células alteradas.
+        O labirinto estático não muda; veja AmbienteDinamico.
+        """
+        return []
+
     def __str__(self):
         """Retorna uma representação do mapa como string para impressão."""
         return "\n".join(["".join(linha) for linha in self.mapa])
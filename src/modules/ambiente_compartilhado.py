@@ -0,0 +1,28 @@
+from modules.ambiente import Ambiente
+from modules.mapa_compartilhado import MapaSobreposto
+
+
+class AmbienteCompartilhado(Ambiente):
+    """
+    Ambiente cujo mapa é uma visão copy-on-write de um MapaCompartilhado.
+    Vários processos podem rodar episódios no mesmo labirinto com uma única
+    cópia da grade em memória; cada um guarda apenas as próprias alterações.
+    """
+    def __init__(self, descritor):
+        # Tamanho, entrada, saída, comidas e análise já foram calculados ao criar o
+        # MapaCompartilhado, evitando percorrer a grade em cada processo.
+        self.mapa = MapaSobreposto(descritor)
+        self.altura = descritor['altura']
+        self.largura = descritor['largura']
+        self.posicao_saida = descritor['saida']
+        self.posicao_agente = None
+        if descritor['entrada'] is not None:
+            x, y = descritor['entrada']
+            self.mapa[y][x] = 'S'  # Coloca o agente no mapa, virado para o Sul
+            self.posicao_agente = [x, y]
+        self.total_comidas = descritor['total_comidas']
+        self._registrar_analise(descritor['analise'])
+
+    def fechar(self):
+        """Desanexa o processo da memória compartilhada ao fim do episódio."""
+        self.mapa.fechar()
@@ -0,0 +1,87 @@
+import random
+
+from modules.ambiente import Ambiente
+
+
+class AmbienteDinamico(Ambiente):
+    """
+    Labirinto que muda durante o episódio. Paredes podem abrir/fechar e
+    comidas consumidas podem reaparecer, seja por um cronograma fixo ou
+    de forma aleatória a cada ciclo.
+    """
+    def __init__(self, arquivo_path, mudancas_agendadas=None, prob_alternar_parede=0.0,
+                 prob_reaparecer_comida=0.0, celulas_dinamicas=None, semente=None):
+        """
+        mudancas_agendadas: dicionário {ciclo: [(x, y, celula), ...]}, com celula em 'X', '_' ou 'o'.
+        prob_alternar_parede: chance, por ciclo, de uma célula de celulas_dinamicas alternar entre 'X' e '_'.
+        prob_reaparecer_comida: chance, por ciclo e por comida consumida, de ela reaparecer no lugar original.
+        celulas_dinamicas: células sorteáveis para alternar paredes (padrão: todo o interior do mapa).
+        """
+        super().__init__(arquivo_path)
+        self.relogio = 0
+        self.mudancas_pendentes = {}
+        for ciclo, mudancas in (mudancas_agendadas or {}).items():
+            for x, y, celula in mudancas:
+                if [x, y] == self.posicao_saida:
+                    raise ValueError(f"Mudança agendada no ciclo {ciclo} sobre a saída ({x}, {y})")
+            self.mudancas_pendentes[ciclo] = list(mudancas)
+        self.prob_alternar_parede = prob_alternar_parede
+        self.prob_reaparecer_comida = prob_reaparecer_comida
+        self.rng = random.Random(semente)
+
+        self.posicoes_comida = [(x, y) for y, linha in enumerate(self.mapa)
+                                for x, celula in enumerate(linha) if celula == 'o']
+        if celulas_dinamicas is None:
+            celulas_dinamicas = [(x, y) for y in range(1, self.altura - 1)
+                                 for x in range(1, self.largura - 1)
+                                 if self.mapa[y][x] in ('X', '_')]
+        self.celulas_dinamicas = [tuple(c) for c in celulas_dinamicas]
+
+    def _celula_fixa(self, x, y):
+        """O agente e a saída nunca são sobrescritos por uma mudança."""
+        return [x, y] == self.posicao_agente or [x, y] == self.posicao_saida
+
+    def _aplicar_mudanca(self, x, y, celula):
+        """Altera uma célula e mantém total_comidas coerente. Retorna True se mudou."""
+        anterior = self.mapa[y][x]
+        if anterior == celula:
+            return False
+        self.mapa[y][x] = celula
+        if celula == 'o':
+            self.total_comidas += 1
+        elif anterior == 'o':
+            self.total_comidas -= 1
+        return True
+
+    def atualizar(self):
+        """
+        Avança o relógio em um ciclo e aplica as mudanças agendadas e aleatórias.
+        Retorna a lista de células (x, y) alteradas neste ciclo.
+        """
+        self.relogio += 1
+        alteradas = []
+
+        # Mudanças agendadas sobre o agente ficam para o próximo ciclo
+        adiadas = []
+        for x, y, celula in self.mudancas_pendentes.pop(self.relogio, []):
+            if [x, y] == self.posicao_agente:
+                adiadas.append((x, y, celula))
+            elif self._aplicar_mudanca(x, y, celula):
+                alteradas.append((x, y))
+        if adiadas:
+            self.mudancas_pendentes.setdefault(self.relogio + 1, []).extend(adiadas)
+
+        if self.celulas_dinamicas and self.rng.random() < self.prob_alternar_parede:
+            x, y = self.rng.choice(self.celulas_dinamicas)
+            if not self._celula_fixa(x, y) and self.mapa[y][x] in ('X', '_'):
+                self._aplicar_mudanca(x, y, '_' if self.mapa[y][x] == 'X' else 'X')
+                alteradas.append((x, y))
+
+        if self.prob_reaparecer_comida > 0:
+            for x, y in self.posicoes_comida:
+                if self.mapa[y][x] == '_' and not self._celula_fixa(x, y) \
+                        and self.rng.random() < self.prob_reaparecer_comida:
+                    self._aplicar_mudanca(x, y, 'o')
+                    alteradas.append((x, y))
+
+        return alteradas
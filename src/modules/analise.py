@@ -0,0 +1,105 @@
+from collections import deque
+
+# Acima deste número de comidas o percurso ótimo exato (Held-Karp) fica caro
+# demais e é substituído por um limite inferior.
+LIMITE_COMIDAS_EXATO = 12
+VIZINHOS = ((0, -1), (0, 1), (1, 0), (-1, 0))
+
+
+def distancias_bfs(mapa, largura, altura, origem, parada=None):
+    """
+    Distância em passos da origem até cada célula livre alcançável.
+    O conjunto de chaves é a componente conexa da origem.
+
+    parada: célula que pode ser alcançada, mas não atravessada. Os agentes
+    tratam a saída como parede até coletar todas as comidas, então nenhum
+    caminho até uma comida pode passar por ela.
+    """
+    origem = tuple(origem)
+    parada = tuple(parada) if parada is not None else None
+    dist = {origem: 0}
+    fila = deque([origem])
+    while fila:
+        x, y = fila.popleft()
+        if (x, y) == parada and (x, y) != origem:
+            continue
+        d = dist[(x, y)] + 1
+        for dx, dy in VIZINHOS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < largura and 0 <= ny < altura and (nx, ny) not in dist \
+                    and mapa[ny][nx] != 'X':
+                dist[(nx, ny)] = d
+                fila.append((nx, ny))
+    return dist
+
+
+def _percurso_minimo(dist_entrada, dist_comidas, comidas, saida):
+    """Held-Karp: menor caminho entrada -> todas as comidas (qualquer ordem) -> saída."""
+    n = len(comidas)
+    if n == 0:
+        return dist_entrada[saida]
+    infinito = float('inf')
+    dp = [[infinito] * n for _ in range(1 << n)]
+    for i, comida in enumerate(comidas):
+        dp[1 << i][i] = dist_entrada[comida]
+    for mascara in range(1, 1 << n):
+        for i in range(n):
+            atual = dp[mascara][i]
+            if atual == infinito or not mascara & (1 << i):
+                continue
+            for j in range(n):
+                if mascara & (1 << j):
+                    continue
+                custo = atual + dist_comidas[i][comidas[j]]
+                if custo < dp[mascara | (1 << j)][j]:
+                    dp[mascara | (1 << j)][j] = custo
+    completo = (1 << n) - 1
+    return min(dp[completo][i] + dist_comidas[i][saida] for i in range(n))
+
+
+def analisar_labirinto(mapa, largura, altura, entrada, saida):
+    """
+    Análise feita ao carregar o labirinto: verifica se todas as comidas e a
+    saída estão na componente conexa da entrada e calcula o menor número de
+    passos possível e, com ele, a melhor pontuação (comidas * 10) - passos.
+
+    Com até LIMITE_COMIDAS_EXATO comidas o valor é exato; acima disso é um
+    limite inferior de passos (logo, um limite superior da pontuação).
+    """
+    comidas = [(x, y) for y, linha in enumerate(mapa)
+               for x, celula in enumerate(linha) if celula == 'o']
+    analise = {
+        'comidas_inalcancaveis': [list(c) for c in comidas],
+        'saida_alcancavel': False,
+        'solucionavel': False,
+        'passos_minimos': None,
+        'passos_minimos_exato': False,
+        'pontuacao_otima': None,
+    }
+    if entrada is None:
+        return analise
+
+    dist_entrada = distancias_bfs(mapa, largura, altura, entrada, saida)
+    analise['comidas_inalcancaveis'] = [list(c) for c in comidas if c not in dist_entrada]
+    analise['saida_alcancavel'] = saida is not None and tuple(saida) in dist_entrada
+    analise['solucionavel'] = analise['saida_alcancavel'] and not analise['comidas_inalcancaveis']
+    if not analise['solucionavel']:
+        return analise
+
+    saida = tuple(saida)
+    if len(comidas) <= LIMITE_COMIDAS_EXATO:
+        dist_comidas = []
+        for comida in comidas:
+            dist = distancias_bfs(mapa, largura, altura, comida, saida)
+            dist_comidas.append({c: dist[c] for c in comidas + [saida]})
+        passos = _percurso_minimo(dist_entrada, dist_comidas, comidas, saida)
+        analise['passos_minimos_exato'] = True
+    else:
+        # Toda comida fica entre a entrada e a saída no percurso completo.
+        # A busca parte da saída, que assim só aparece no fim de cada caminho.
+        dist_saida = distancias_bfs(mapa, largura, altura, saida)
+        passos = max(dist_entrada[c] + dist_saida[c] for c in comidas)
+
+    analise['passos_minimos'] = passos
+    analise['pontuacao_otima'] = (len(comidas) * 10) - passos
+    return analise
@@ -0,0 +1,122 @@
+from multiprocessing import shared_memory
+
+from modules.analise import analisar_labirinto
+
+
+class MapaCompartilhado:
+    """
+    Grade base do labirinto em multiprocessing.shared_memory, um byte por
+    célula. É criada uma única vez pelo processo principal; os trabalhadores
+    se anexam pelo descritor e leem a grade sem copiá-la.
+    """
+    def __init__(self, shm, descritor):
+        self.shm = shm
+        self.descritor = descritor
+
+    @classmethod
+    def criar(cls, arquivo_path):
+        """Carrega o labirinto de um arquivo TXT e o publica em memória compartilhada."""
+        with open(arquivo_path, 'r') as f:
+            linhas = [line.strip() for line in f.readlines()]
+        altura = len(linhas)
+        largura = max(len(linha) for linha in linhas)
+
+        shm = shared_memory.SharedMemory(create=True, size=largura * altura)
+        descritor = {'nome': shm.name, 'largura': largura, 'altura': altura,
+                     'entrada': None, 'saida': None, 'total_comidas': 0}
+        try:
+            for y, linha in enumerate(linhas):
+                # Linhas mais curtas são completadas com parede
+                shm.buf[y * largura:(y + 1) * largura] = linha.ljust(largura, 'X').encode('ascii')
+                descritor['total_comidas'] += linha.count('o')
+                if descritor['entrada'] is None and 'E' in linha:
+                    descritor['entrada'] = [linha.index('E'), y]
+                if descritor['saida'] is None and 'S' in linha:
+                    descritor['saida'] = [linha.index('S'), y]
+            # A análise de alcance também é feita uma única vez, aqui
+            linhas = [linha.ljust(largura, 'X') for linha in linhas]
+            descritor['analise'] = analisar_labirinto(linhas, largura, altura,
+                                                      descritor['entrada'], descritor['saida'])
+        except Exception:
+            shm.close()
+            shm.unlink()
+            raise
+        return cls(shm, descritor)
+
+    def liberar(self):
+        """Fecha e remove o bloco compartilhado (apenas no processo que o criou)."""
+        self.shm.close()
+        self.shm.unlink()
+
+
+class _LinhaSobreposta:
+    """Uma linha de MapaSobreposto; permite mapa[y][x] para leitura e escrita."""
+    def __init__(self, mapa, y):
+        self.mapa = mapa
+        self.y = y
+
+    def __len__(self):
+        return self.mapa.largura
+
+    def __getitem__(self, x):
+        return self.mapa.ler(x, self.y)
+
+    def __setitem__(self, x, celula):
+        self.mapa.escrever(x, self.y, celula)
+
+    def __iter__(self):
+        for x in range(self.mapa.largura):
+            yield self.mapa.ler(x, self.y)
+
+    def count(self, celula):
+        return sum(1 for c in self if c == celula)
+
+
+class MapaSobreposto:
+    """
+    Visão copy-on-write de um MapaCompartilhado. Leituras vêm da grade
+    compartilhada (somente leitura); escritas (comida consumida, marcas do
+    agente) ficam num dicionário local, então cada processo guarda só as
+    células que alterou.
+    """
+    def __init__(self, descritor):
+        self.largura = descritor['largura']
+        self.altura = descritor['altura']
+        self.shm = shared_memory.SharedMemory(name=descritor['nome'])
+        self.base = self.shm.buf.toreadonly()
+        self.sobreposicao = {}
+
+    def _indice(self, x, y):
+        if not (0 <= x < self.largura and 0 <= y < self.altura):
+            raise IndexError(f"Posição ({x}, {y}) fora do mapa")
+        return y * self.largura + x
+
+    def ler(self, x, y):
+        celula = self.sobreposicao.get((x, y))
+        if celula is None:
+            celula = chr(self.base[self._indice(x, y)])
+        return celula
+
+    def escrever(self, x, y, celula):
+        # Voltar ao valor original descarta a entrada local
+        if chr(self.base[self._indice(x, y)]) == celula:
+            self.sobreposicao.pop((x, y), None)
+        else:
+            self.sobreposicao[(x, y)] = celula
+
+    def __len__(self):
+        return self.altura
+
+    def __getitem__(self, y):
+        if not 0 <= y < self.altura:
+            raise IndexError(f"Linha {y} fora do mapa")
+        return _LinhaSobreposta(self, y)
+
+    def __iter__(self):
+        for y in range(self.altura):
+            yield _LinhaSobreposta(self, y)
+
+    def fechar(self):
+        """Desanexa este processo da memória compartilhada."""
+        self.base.release()
+        self.shm.close()
@@ -0,0 +1,146 @@
+import heapq
+
+INFINITO = float('inf')
+VIZINHOS = ((0, -1), (0, 1), (1, 0), (-1, 0))
+
+
+class PlanejadorDStarLite:
+    """
+    Planejador incremental D* Lite sobre a grade do labirinto (4-vizinhança,
+    custo 1 por passo). As distâncias são calculadas a partir dos objetivos,
+    então o agente pode se mover e as células podem mudar sem replanejar do
+    zero: só os vértices afetados por uma mudança são reexpandidos.
+
+    Como o conjunto de objetivos muda durante o episódio (comidas, saída,
+    células desconhecidas), a heurística usada é h = 0; assim as chaves não
+    dependem da posição do agente e o modificador km do D* Lite é dispensável.
+
+    Nada é alocado para a grade inteira: uma célula sem entrada em g/rhs vale
+    0 se for objetivo e INFINITO caso contrário. O agente precisa informar
+    (atualizar_celulas) toda célula cujo terreno ou status de objetivo mudar,
+    inclusive quando ela é vista pela primeira vez.
+    """
+    def __init__(self, largura, altura, livre, objetivo, inicio):
+        """
+        livre(x, y): True se a célula pode ser ocupada pelo agente.
+        objetivo(x, y): True se a célula é um destino (distância zero).
+        """
+        self.largura = largura
+        self.altura = altura
+        self.livre = livre
+        self.objetivo = objetivo
+        self.inicio = tuple(inicio)
+
+        self.g = {}
+        self.rhs = {}
+        self.fila = []
+        self.chaves = {}  # Chave atual de cada célula na fila (remoção preguiçosa)
+        self.expansoes = 0  # Contador de expansões, útil para medir o custo do replanejamento
+
+    def _padrao(self, celula):
+        """Valor implícito de g e rhs para células ainda não tocadas pela busca."""
+        return 0 if self.objetivo(*celula) else INFINITO
+
+    def _g(self, celula):
+        g = self.g.get(celula)
+        return self._padrao(celula) if g is None else g
+
+    def _rhs(self, celula):
+        rhs = self.rhs.get(celula)
+        return self._padrao(celula) if rhs is None else rhs
+
+    def _vizinhos(self, celula):
+        x, y = celula
+        for dx, dy in VIZINHOS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.largura and 0 <= ny < self.altura:
+                yield (nx, ny)
+
+    def _chave(self, celula):
+        return min(self._g(celula), self._rhs(celula))
+
+    def _inserir(self, celula, chave):
+        self.chaves[celula] = chave
+        heapq.heappush(self.fila, (chave, celula))
+
+    def _atualizar_vertice(self, celula):
+        """Recalcula rhs da célula e a (re)coloca na fila se estiver inconsistente."""
+        if self.objetivo(*celula):
+            rhs = 0
+        elif not self.livre(*celula):
+            rhs = INFINITO
+        else:
+            rhs = min((1 + self._g(v) for v in self._vizinhos(celula) if self.livre(*v)),
+                      default=INFINITO)
+        self.rhs[celula] = rhs
+
+        self.chaves.pop(celula, None)
+        g = self._g(celula)
+        if g != rhs:
+            self._inserir(celula, min(g, rhs))
+        elif rhs == self._padrao(celula):
+            # Consistente e igual ao valor implícito: a entrada é dispensável
+            self.g.pop(celula, None)
+            self.rhs.pop(celula, None)
+
+    def _topo(self):
+        """Descarta entradas obsoletas e retorna a menor chave da fila."""
+        while self.fila:
+            chave, celula = self.fila[0]
+            if self.chaves.get(celula) == chave:
+                return chave
+            heapq.heappop(self.fila)
+        return INFINITO
+
+    def calcular_caminho(self):
+        """Expande vértices até a distância da posição do agente ficar consistente."""
+        while self._topo() < self._chave(self.inicio) or \
+                self._g(self.inicio) != self._rhs(self.inicio):
+            if not self.fila:
+                break
+            _, celula = heapq.heappop(self.fila)
+            del self.chaves[celula]
+            self.expansoes += 1
+
+            if self._g(celula) > self._rhs(celula):
+                self.g[celula] = self._rhs(celula)
+            else:
+                self.g[celula] = INFINITO
+                self._atualizar_vertice(celula)
+            for vizinho in self._vizinhos(celula):
+                self._atualizar_vertice(vizinho)
+
+    def atualizar_celulas(self, celulas):
+        """
+        Informa ao planejador que as células mudaram (parede, comida ou objetivo).
+        Apenas a célula e seus vizinhos são recolocados na fila.
+        """
+        afetadas = set()
+        for celula in celulas:
+            celula = tuple(celula)
+            afetadas.add(celula)
+            afetadas.update(self._vizinhos(celula))
+        for celula in afetadas:
+            self._atualizar_vertice(celula)
+
+    def mover_inicio(self, posicao):
+        """Atualiza a posição do agente; com h = 0 nenhuma chave precisa mudar."""
+        self.inicio = tuple(posicao)
+
+    def distancia(self):
+        """Número de passos até o objetivo mais próximo (INFINITO se inalcançável)."""
+        return self._g(self.inicio)
+
+    def proximo_passo(self):
+        """
+        Retorna a próxima célula (x, y) do caminho ótimo, ou None se o agente
+        já está num objetivo ou nenhum objetivo é alcançável.
+        """
+        self.calcular_caminho()
+        if self.objetivo(*self.inicio) or self.distancia() == INFINITO:
+            return None
+        melhor, melhor_custo = None, INFINITO
+        for vizinho in self._vizinhos(self.inicio):
+            if self.livre(*vizinho) and 1 + self._g(vizinho) < melhor_custo:
+                melhor, melhor_custo = vizinho, 1 + self._g(vizinho)
+        return melhor
@@ -0,0 +1,153 @@
+import contextlib
+import copy
+import io
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.ambiente import Ambiente
+from modules.ambiente_compartilhado import AmbienteCompartilhado
+from modules.agente import Agente
+from modules.agente_planejador import AgentePlanejador
+from modules.mapa_compartilhado import MapaCompartilhado
+
+POLITICAS = {
+    'reativa': Agente,
+    'dstar': AgentePlanejador,
+}
+
+LIMITE_LABIRINTOS_EM_CACHE = 8
+
+# Labirintos já carregados neste processo: caminho -> (data de modificação, Ambiente),
+# do menos para o mais recentemente usado
+_labirintos = OrderedDict()
+
+
+def carregar_labirinto(arquivo_path):
+    """
+    Retorna uma cópia nova do labirinto, lendo o arquivo só na primeira vez
+    (ou quando ele for modificado). Cada simulação altera o mapa, então o
+    original em cache nunca é entregue.
+    """
+    arquivo_path = os.path.abspath(arquivo_path)
+    modificacao = os.stat(arquivo_path).st_mtime_ns
+    em_cache = _labirintos.get(arquivo_path)
+    if em_cache is None or em_cache[0] != modificacao:
+        # Uma versão antiga do mesmo arquivo é substituída, não acumulada
+        with contextlib.redirect_stdout(io.StringIO()):
+            em_cache = (modificacao, Ambiente(arquivo_path))
+        _labirintos[arquivo_path] = em_cache
+    _labirintos.move_to_end(arquivo_path)
+    while len(_labirintos) > LIMITE_LABIRINTOS_EM_CACHE:
+        _labirintos.popitem(last=False)
+    return copy.deepcopy(em_cache[1])
+
+
+def _resultado_ignorado(politica, comidas_inalcancaveis, saida_alcancavel):
+    """Resultado de um labirinto sem solução, que não chega a ser executado."""
+    return {
+        'politica': politica,
+        'concluido': False,
+        'ignorado': True,
+        'comidas_inalcancaveis': comidas_inalcancaveis,
+        'saida_alcancavel': saida_alcancavel,
+    }
+
+
+def razao_otimo(pontuacao, otima, passos_minimos, concluido):
+    """
+    Quanto do ótimo um episódio concluído atingiu. O teto é a pontuação
+    sem nenhum passo (comidas * 10, ou seja, otima + passos_minimos); a
+    razão divide o que o ótimo perde em relação ao teto pelo que o episódio
+    perdeu. Vale 1 no ótimo e tende a 0 conforme sobram passos, com
+    pontuações positivas ou negativas e sem depender do orçamento.
+
+    Retorna None se o episódio não chegou à saída (parado ou sem orçamento:
+    não há percurso completo para comparar) ou se o ótimo não é conhecido.
+    Como a ótima é calculada no mapa inicial, comidas que reaparecem em
+    labirintos dinâmicos podem levar a razão acima de 1.
+    """
+    if not concluido or otima is None:
+        return None
+    perda = (otima + passos_minimos) - pontuacao
+    if perda <= 0:
+        return None
+    return passos_minimos / perda
+
+
+def simular(ambiente, politica='reativa', limite_passos=1000, ignorar_insoluveis=True):
+    """
+    Executa um episódio sem terminal, pausas ou vídeo e retorna o resultado
+    como dicionário. O episódio termina ao chegar à saída com todas as comidas
+    ou quando o orçamento de passos (ciclos de decisão) se esgota.
+
+    Labirintos sem solução (comida ou saída inalcançável) são ignorados sem
+    gastar o orçamento, a menos que ignorar_insoluveis seja False.
+    """
+    if politica not in POLITICAS:
+        raise ValueError(f"Política desconhecida '{politica}'. Opções: {', '.join(POLITICAS)}")
+
+    if not ambiente.solucionavel and ignorar_insoluveis:
+        return _resultado_ignorado(politica, ambiente.comidas_inalcancaveis, ambiente.saida_alcancavel)
+
+    concluido = False
+    with contextlib.redirect_stdout(io.StringIO()):
+        agente = POLITICAS[politica](ambiente, ambiente.total_comidas, registrar_historico=False)
+        for _ in range(limite_passos):
+            if agente.executar_ciclo():
+                concluido = True
+                break
+
+    pontuacao = (agente.comidas_coletadas * 10) - agente.passos
+    otima = ambiente.pontuacao_otima
+    return {
+        'politica': politica,
+        'concluido': concluido,
+        'ignorado': False,
+        'comidas_coletadas': agente.comidas_coletadas,
+        'total_comidas': agente.total_comidas_no_mapa,
+        'passos': agente.passos,
+        'pontuacao': pontuacao,
+        'pontuacao_otima': otima,
+        'pontuacao_otima_exata': ambiente.passos_minimos_exato,
+        'razao_otimo': razao_otimo(pontuacao, otima, ambiente.passos_minimos, concluido),
+        'eficiencia_passos': ambiente.passos_minimos / agente.passos
+        if concluido and ambiente.passos_minimos and agente.passos else None,
+    }
+
+
+def executar_pedido(pedido):
+    """Ponto de entrada dos processos trabalhadores: labirinto + política + orçamento."""
+    ambiente = carregar_labirinto(pedido['labirinto'])
+    return simular(ambiente, pedido['politica'], pedido['limite_passos'])
+
+
+def _executar_episodio_compartilhado(descritor, politica, limite_passos):
+    """Ponto de entrada dos trabalhadores em simular_em_paralelo."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ambiente = AmbienteCompartilhado(descritor)
+    try:
+        return simular(ambiente, politica, limite_passos)
+    finally:
+        ambiente.fechar()
+
+
+def simular_em_paralelo(arquivo_path, politica='reativa', limite_passos=1000, episodios=1, trabalhadores=None):
+    """
+    Executa vários episódios no mesmo labirinto em paralelo. A grade é
+    colocada uma única vez em memória compartilhada; cada processo mantém
+    apenas as células que alterou.
+    """
+    mapa = MapaCompartilhado.criar(arquivo_path)
+    try:
+        if not mapa.descritor['analise']['solucionavel']:
+            # Labirinto sem solução: nenhum processo precisa ser iniciado
+            analise = mapa.descritor['analise']
+            return [_resultado_ignorado(politica, analise['comidas_inalcancaveis'], analise['saida_alcancavel'])
+                    for _ in range(episodios)]
+        with ProcessPoolExecutor(max_workers=trabalhadores) as pool:
+            futuros = [pool.submit(_executar_episodio_compartilhado, mapa.descritor, politica, limite_passos)
+                       for _ in range(episodios)]
+            return [futuro.result() for futuro in futuros]
+    finally:
+        mapa.liberar()
@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from modules.simulacao import POLITICAS, carregar_labirinto, executar_pedido
+
+DIRETORIO_PROJETO = os.path.join(os.path.dirname(__file__), "..")
+ARQUIVO_LABIRINTO = os.path.join(DIRETORIO_PROJETO, "labirinto.txt")
+LIMITE_CACHE = 1024
+# Sem timeout nos trabalhadores, o orçamento limita quanto tempo um pedido ocupa um processo
+LIMITE_MAXIMO_PASSOS = 100_000
+
+
+class ServicoSimulacao:
+    """
+    Mantém um pool de processos aquecidos e um cache de resultados.
+    Pedidos idênticos (mesmo labirinto, sem alterações no arquivo, mesma
+    política e orçamento) compartilham o mesmo resultado, inclusive enquanto
+    ainda estão em execução.
+    """
+    def __init__(self, trabalhadores=None, labirintos_iniciais=(), limite_cache=LIMITE_CACHE,
+                 diretorio=DIRETORIO_PROJETO, limite_maximo_passos=LIMITE_MAXIMO_PASSOS):
+        # Só arquivos dentro deste diretório podem ser pedidos como labirinto
+        self.diretorio = os.path.realpath(diretorio)
+        self.limite_maximo_passos = limite_maximo_passos
+        self.labirintos_iniciais = [os.path.abspath(p) for p in labirintos_iniciais]
+        self.pool = ProcessPoolExecutor(max_workers=trabalhadores,
+                                        initializer=self._aquecer,
+                                        initargs=(self.labirintos_iniciais,))
+        # Os processos são criados sob demanda; uma rodada de tarefas vazias
+        # garante que todos já estejam prontos antes do primeiro pedido.
+        for futuro in [self.pool.submit(os.getpid) for _ in range(trabalhadores or os.cpu_count() or 1)]:
+            futuro.result()
+        # Resultados do menos para o mais recentemente usado (LRU)
+        self.cache = OrderedDict()
+        self.limite_cache = limite_cache
+        self.versoes = {}  # Data de modificação mais recente vista de cada labirinto
+        self.trava = threading.Lock()
+        self.acertos = 0
+        self.execucoes = 0
+
+    @staticmethod
+    def _aquecer(labirintos):
+        """Executado uma vez em cada processo: carrega os labirintos informados."""
+        for arquivo_path in labirintos:
+            carregar_labirinto(arquivo_path)
+
+    def _normalizar(self, dados):
+        """Valida o pedido JSON e preenche os valores padrão."""
+        labirinto = dados.get('labirinto', 'labirinto.txt')
+        politica = dados.get('politica', 'reativa')
+        limite_passos = dados.get('limite_passos', 1000)
+        if not isinstance(labirinto, str):
+            raise ValueError("'labirinto' deve ser o caminho de um arquivo.")
+        # Caminhos relativos partem do diretório de labirintos; links simbólicos
+        # e '..' são resolvidos antes da verificação
+        caminho = os.path.realpath(os.path.join(self.diretorio, labirinto))
+        if os.path.commonpath([caminho, self.diretorio]) != self.diretorio:
+            raise ValueError(f"O arquivo '{labirinto}' está fora do diretório de labirintos.")
+        if not os.path.isfile(caminho):
+            raise ValueError(f"O arquivo '{labirinto}' não foi encontrado.")
+        if not isinstance(politica, str) or politica not in POLITICAS:
+            raise ValueError(f"Política desconhecida '{politica}'. Opções: {', '.join(POLITICAS)}")
+        # bool é subclasse de int: True não pode virar um orçamento de 1 passo
+        if isinstance(limite_passos, bool) or not isinstance(limite_passos, int) \
+                or not 0 < limite_passos <= self.limite_maximo_passos:
+            raise ValueError(f"'limite_passos' deve ser um inteiro entre 1 e {self.limite_maximo_passos}.")
+        return {'labirinto': caminho, 'politica': politica, 'limite_passos': limite_passos}
+
+    def simular(self, dados):
+        pedido = self._normalizar(dados)
+        modificacao = os.stat(pedido['labirinto']).st_mtime_ns
+        chave = (pedido['labirinto'], modificacao, pedido['politica'], pedido['limite_passos'])
+        with self.trava:
+            futuro = self.cache.get(chave)
+            if futuro is None:
+                self._descartar_versoes_antigas(pedido['labirinto'], modificacao)
+                futuro = self.pool.submit(executar_pedido, pedido)
+                self.cache[chave] = futuro
+                while len(self.cache) > self.limite_cache:
+                    self.cache.popitem(last=False)
+                self.execucoes += 1
+                em_cache = False
+            else:
+                self.cache.move_to_end(chave)
+                self.acertos += 1
+                em_cache = True
+        try:
+            resultado = futuro.result()
+        except Exception:
+            # Falhas não ficam em cache: o próximo pedido tenta de novo
+            with self.trava:
+                if self.cache.get(chave) is futuro:
+                    del self.cache[chave]
+            raise
+        return dict(resultado, em_cache=em_cache)
+
+    def _descartar_versoes_antigas(self, labirinto, modificacao):
+        """Remove resultados de versões anteriores do arquivo (chamado com a trava)."""
+        if self.versoes.get(labirinto, modificacao) != modificacao:
+            for chave in [c for c in self.cache if c[0] == labirinto]:
+                del self.cache[chave]
+        self.versoes[labirinto] = modificacao
+
+    def estatisticas(self):
+        with self.trava:
+            return {'execucoes': self.execucoes, 'acertos_cache': self.acertos, 'entradas_cache': len(self.cache)}
+
+    def encerrar(self):
+        self.pool.shutdown()
+
+
+class ManipuladorHTTP(BaseHTTPRequestHandler):
+    """POST /simular executa um pedido; GET /saude retorna as estatísticas do serviço."""
+    servico = None
+
+    def _responder(self, status, corpo):
+        dados = json.dumps(corpo, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(dados)))
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def do_GET(self):
+        if self.path == '/saude':
+            self._responder(200, self.servico.estatisticas())
+        else:
+            self._responder(404, {'erro': 'Rota não encontrada.'})
+
+    def do_POST(self):
+        if self.path != '/simular':
+            self._responder(404, {'erro': 'Rota não encontrada.'})
+            return
+        try:
+            tamanho = int(self.headers.get('Content-Length', 0))
+            dados = json.loads(self.rfile.read(tamanho) or b'{}')
+            if not isinstance(dados, dict):
+                raise ValueError("O corpo do pedido deve ser um objeto JSON.")
+            self._responder(200, self.servico.simular(dados))
+        except ValueError as erro:
+            self._responder(400, {'erro': str(erro)})
+        except Exception as erro:
+            self._responder(500, {'erro': f"{type(erro).__name__}: {erro}"})
+
+    def log_message(self, formato, *args):
+        pass  # Silencia o log de cada requisição
+
+
+# =============================================================================
+# Programa Principal
+# =============================================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serviço local de simulação do labirinto.")
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--trabalhadores', type=int, default=None,
+                        help="Número de processos (padrão: número de CPUs).")
+    parser.add_argument('--limite-cache', type=int, default=LIMITE_CACHE,
+                        help="Número máximo de resultados guardados em cache.")
+    parser.add_argument('--diretorio', default=DIRETORIO_PROJETO,
+                        help="Diretório de onde os labirintos podem ser lidos (padrão: raiz do projeto).")
+    parser.add_argument('--limite-maximo-passos', type=int, default=LIMITE_MAXIMO_PASSOS,
+                        help="Maior orçamento de passos aceito por pedido.")
+    parser.add_argument('--labirintos', nargs='*', default=[ARQUIVO_LABIRINTO],
+                        help="Labirintos carregados antecipadamente em cada processo.")
+    args = parser.parse_args()
+
+    servico = ServicoSimulacao(args.trabalhadores, args.labirintos, args.limite_cache,
+                               args.diretorio, args.limite_maximo_passos)
+    ManipuladorHTTP.servico = servico
+    # Apenas localhost: o serviço não deve ser exposto na rede
+    servidor = ThreadingHTTPServer(('127.0.0.1', args.porta), ManipuladorHTTP)
+    print(f"Serviço de simulação em http://127.0.0.1:{args.porta} (POST /simular, GET /saude)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        servico.encerrar()
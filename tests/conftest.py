@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Os módulos são importados como `modules.*`, a partir de src/ (igual a src/main.py)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
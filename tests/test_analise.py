@@ -0,0 +1,69 @@
+import os
+
+from modules.ambiente import Ambiente
+from modules.simulacao import razao_otimo, simular
+
+ARQUIVO_LABIRINTO = os.path.join(os.path.dirname(__file__), "..", "labirinto.txt")
+
+
+def test_analise_do_labirinto_padrao():
+    ambiente = Ambiente(ARQUIVO_LABIRINTO)
+    assert ambiente.solucionavel
+    assert ambiente.passos_minimos == 44 and ambiente.passos_minimos_exato
+    assert ambiente.pontuacao_otima == 4 * 10 - 44
+
+
+def test_comida_e_saida_inalcancaveis(tmp_path):
+    arquivo = tmp_path / "fechado.txt"
+    arquivo.write_text("XXXXXX\nXE_XoX\nX__XSX\nXXXXXX\n")
+    ambiente = Ambiente(str(arquivo))
+    assert not ambiente.solucionavel
+    assert ambiente.comidas_inalcancaveis == [[4, 1]]
+    assert not ambiente.saida_alcancavel
+    assert simular(ambiente, 'reativa')['ignorado']
+
+
+def test_caminho_pela_saida_nao_conta(tmp_path):
+    # A única passagem até a comida atravessa a saída, que os agentes
+    # tratam como parede enquanto ainda há comida a coletar
+    arquivo = tmp_path / "saida_no_caminho.txt"
+    arquivo.write_text("XXXXXXX\nXE__S_X\nXXXXXoX\nXXXXXXX\n")
+    ambiente = Ambiente(str(arquivo))
+    assert not ambiente.solucionavel
+    assert ambiente.comidas_inalcancaveis == [[5, 2]]
+    assert ambiente.saida_alcancavel
+    assert ambiente.pontuacao_otima is None
+    assert simular(ambiente, 'dstar')['ignorado']
+
+
+def test_razao_otimo_com_pontuacoes_negativas():
+    # Labirinto padrão: 4 comidas, 44 passos mínimos, ótima -4
+    assert razao_otimo(-4, -4, 44, True) == 1
+    assert razao_otimo(-48, -4, 44, True) == 0.5
+    assert 0 < razao_otimo(-220, -4, 44, True) < razao_otimo(-90, -4, 44, True) < 1
+    assert razao_otimo(-4, None, None, True) is None
+
+
+def test_razao_otimo_so_para_episodios_concluidos():
+    # Parado na entrada ou sem orçamento: nenhuma razão, qualquer que seja a pontuação
+    assert razao_otimo(0, -4, 44, False) is None
+    assert razao_otimo(-4, -4, 44, False) is None
+
+
+def test_razao_otimo_nao_depende_do_orcamento():
+    curto = simular(Ambiente(ARQUIVO_LABIRINTO), 'reativa', 1000)
+    longo = simular(Ambiente(ARQUIVO_LABIRINTO), 'reativa', 5000)
+    assert curto['concluido']
+    assert curto['razao_otimo'] == longo['razao_otimo']
+
+
+def test_simular_sem_concluir_nao_reporta_razao():
+    resultado = simular(Ambiente(ARQUIVO_LABIRINTO), 'dstar', 10)
+    assert not resultado['concluido']
+    assert resultado['razao_otimo'] is None
+
+
+def test_simular_reporta_razao_no_labirinto_padrao():
+    resultado = simular(Ambiente(ARQUIVO_LABIRINTO), 'dstar', 1000)
+    assert resultado['razao_otimo'] is not None
+    assert 0 < resultado['razao_otimo'] <= 1
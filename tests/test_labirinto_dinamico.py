@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from modules.agente import Agente
+from modules.agente_planejador import AgentePlanejador
+from modules.ambiente import Ambiente
+from modules.ambiente_dinamico import AmbienteDinamico
+from modules.simulacao import simular
+
+ARQUIVO_LABIRINTO = os.path.join(os.path.dirname(__file__), "..", "labirinto.txt")
+
+
+def test_planejador_alcanca_saida_com_paredes_aleatorias():
+    # Regressão: o agente ficava parado para sempre depois de coletar as
+    # comidas, pois nunca reverificava paredes que já tinha visto.
+    for semente in range(5):
+        ambiente = AmbienteDinamico(ARQUIVO_LABIRINTO, prob_alternar_parede=0.2, semente=semente)
+        resultado = simular(ambiente, 'dstar', 3000)
+        assert resultado['concluido'], f"semente {semente}: {resultado}"
+
+
+def test_planejador_nao_aloca_a_grade_inteira():
+    ambiente = Ambiente(ARQUIVO_LABIRINTO)
+    agente = AgentePlanejador(ambiente, ambiente.total_comidas)
+    assert not agente.planejador.g and not agente.planejador.rhs and not agente.planejador.fila
+
+    agente._decidir_proxima_acao(agente.getSensor())
+    # Só as células vistas (3x3) e seus vizinhos são tocados
+    assert len(agente.planejador.rhs) <= 25
+
+
+def test_mudanca_agendada_na_saida_e_rejeitada():
+    ambiente = Ambiente(ARQUIVO_LABIRINTO)
+    x, y = ambiente.posicao_saida
+    with pytest.raises(ValueError):
+        AmbienteDinamico(ARQUIVO_LABIRINTO, mudancas_agendadas={1: [(x, y, 'X')]})
+
+
+def test_mudanca_agendada_no_agente_e_adiada():
+    ambiente = AmbienteDinamico(ARQUIVO_LABIRINTO, mudancas_agendadas={1: [(1, 1, 'o')]})
+    assert ambiente.atualizar() == []
+    assert ambiente.mudancas_pendentes[2] == [(1, 1, 'o')]
+
+    ambiente.mover_agente(1, 1, 2, 1, 'L')
+    assert ambiente.atualizar() == [(1, 1)]
+    assert ambiente.mapa[1][1] == 'o'
+
+
+def test_agente_nao_atravessa_parede_que_fechou():
+    # O Agente base nunca atualiza a memória: a parede nova só é descoberta ao bater nela
+    ambiente = AmbienteDinamico(ARQUIVO_LABIRINTO, mudancas_agendadas={2: [(2, 1, 'X')]})
+    agente = Agente(ambiente, ambiente.total_comidas)
+    ambiente.atualizar()
+    agente.getSensor()
+    ambiente.atualizar()
+
+    agente.setDirection('L')
+    assert not agente.move()
+    assert (agente.x, agente.y) == (1, 1)
+    assert agente.memoria[(2, 1)] == 'X'
+
+
+def test_sem_caminho_so_paredes_da_borda_da_regiao_sao_esquecidas(tmp_path):
+    arquivo = tmp_path / "fechado.txt"
+    arquivo.write_text("XXXXXXX\nXE__X_X\nX___XSX\nXXXXXXX\n")
+    ambiente = Ambiente(str(arquivo))
+    agente = AgentePlanejador(ambiente, ambiente.total_comidas)
+    agente.memoria.update({(x, y): ambiente.mapa[y][x] for y in range(4) for x in range(7)})
+    agente.memoria[(1, 1)] = '_'
+
+    agente._esquecer_paredes_da_regiao()
+
+    # Corredores conhecidos permanecem; só a parede interna (4, y) é esquecida
+    assert agente.celulas_alteradas == {(4, 1), (4, 2)}
+    assert all(agente.memoria[(x, y)] == '_' for x in (1, 2, 3) for y in (1, 2))
+
+
+def test_desconhecidas_deixam_de_ser_objetivo_com_a_saida_vista():
+    ambiente = Ambiente(ARQUIVO_LABIRINTO)
+    agente = AgentePlanejador(ambiente, ambiente.total_comidas)
+    agente.comidas_coletadas = ambiente.total_comidas  # Só falta a saída
+    agente.executar_ciclo()
+    assert agente.planejador.objetivo(12, 12)  # Saída ainda não vista: explora
+
+    agente.memoria[(7, 13)] = 'S'
+    agente.saida_vista = True
+    agente.executar_ciclo()
+    assert not agente.explorando
+    assert not agente.planejador.objetivo(12, 12)
+    assert agente.planejador.objetivo(7, 13)
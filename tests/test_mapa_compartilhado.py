@@ -0,0 +1,87 @@
+import os
+from multiprocessing import shared_memory
+
+import pytest
+
+from modules.ambiente import Ambiente
+from modules.ambiente_compartilhado import AmbienteCompartilhado
+from modules.mapa_compartilhado import MapaCompartilhado, MapaSobreposto
+from modules.simulacao import POLITICAS, simular, simular_em_paralelo
+
+ARQUIVO_LABIRINTO = os.path.join(os.path.dirname(__file__), "..", "labirinto.txt")
+
+
+@pytest.fixture
+def mapa():
+    mapa = MapaCompartilhado.criar(ARQUIVO_LABIRINTO)
+    yield mapa
+    mapa.liberar()
+
+
+def test_leituras_e_escritas_na_sobreposicao(mapa):
+    sobreposto = MapaSobreposto(mapa.descritor)
+    try:
+        assert sobreposto[1][1] == 'E'
+        assert sobreposto[5][2] == 'o'
+        assert len(sobreposto) == 15 and len(sobreposto[0]) == 13
+
+        sobreposto[5][2] = '_'
+        assert sobreposto[5][2] == '_'
+        assert sobreposto.sobreposicao == {(2, 5): '_'}
+        # A grade compartilhada não muda
+        assert chr(mapa.shm.buf[5 * 13 + 2]) == 'o'
+
+        # Voltar ao valor original descarta a entrada local
+        sobreposto[5][2] = 'o'
+        assert sobreposto.sobreposicao == {}
+    finally:
+        sobreposto.fechar()
+
+
+def test_grade_base_somente_leitura(mapa):
+    sobreposto = MapaSobreposto(mapa.descritor)
+    try:
+        assert sobreposto.base.readonly
+        with pytest.raises(TypeError):
+            sobreposto.base[0] = ord('_')
+    finally:
+        sobreposto.fechar()
+
+
+def test_ambiente_compartilhado_igual_ao_carregado_do_arquivo(mapa):
+    ambiente = Ambiente(ARQUIVO_LABIRINTO)
+    compartilhado = AmbienteCompartilhado(mapa.descritor)
+    try:
+        assert str(compartilhado) == str(ambiente)
+        assert compartilhado.posicao_agente == ambiente.posicao_agente
+        assert compartilhado.pontuacao_otima == ambiente.pontuacao_otima
+    finally:
+        compartilhado.fechar()
+
+
+@pytest.mark.parametrize("politica", list(POLITICAS))
+def test_paralelo_igual_ao_serial(politica):
+    serial = simular(Ambiente(ARQUIVO_LABIRINTO), politica, 1000)
+    paralelo = simular_em_paralelo(ARQUIVO_LABIRINTO, politica, 1000, episodios=2, trabalhadores=2)
+    assert paralelo == [serial, serial]
+
+
+def test_labirinto_sem_solucao_nao_inicia_processos(tmp_path, monkeypatch):
+    arquivo = tmp_path / "fechado.txt"
+    arquivo.write_text("XXXXXX\nXE_XoX\nX__XSX\nXXXXXX\n")
+
+    def falhar(*args, **kwargs):
+        raise AssertionError("nenhum processo deveria ser iniciado")
+    monkeypatch.setattr('modules.simulacao.ProcessPoolExecutor', falhar)
+
+    resultados = simular_em_paralelo(str(arquivo), 'dstar', episodios=3)
+    assert len(resultados) == 3
+    assert all(r['ignorado'] and r['comidas_inalcancaveis'] == [[4, 1]] for r in resultados)
+
+
+def test_bloco_removido_apos_liberar():
+    mapa = MapaCompartilhado.criar(ARQUIVO_LABIRINTO)
+    nome = mapa.descritor['nome']
+    mapa.liberar()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=nome)
@@ -0,0 +1,73 @@
+import os
+import shutil
+
+import pytest
+
+from modules import simulacao
+from servidor import ServicoSimulacao
+
+ARQUIVO_LABIRINTO = os.path.join(os.path.dirname(__file__), "..", "labirinto.txt")
+
+
+@pytest.fixture(scope="module")
+def servico(tmp_path_factory):
+    # Os testes de cache usam cópias do labirinto neste diretório
+    servico = ServicoSimulacao(trabalhadores=1, limite_cache=2,
+                               diretorio=str(tmp_path_factory.getbasetemp()), limite_maximo_passos=5000)
+    yield servico
+    servico.encerrar()
+
+
+@pytest.mark.parametrize("dados", [
+    {'limite_passos': True},
+    {'limite_passos': 0},
+    {'labirinto': 5},
+    {'labirinto': 'nao_existe.txt'},
+    {'politica': ['dstar']},
+    {'limite_passos': 5001},
+    {'labirinto': '/etc/passwd'},
+    {'labirinto': '../../etc/passwd'},
+    {'labirinto': ARQUIVO_LABIRINTO},  # Existe, mas fora do diretório configurado
+])
+def test_pedidos_invalidos_sao_rejeitados(servico, dados):
+    with pytest.raises(ValueError):
+        servico.simular(dados)
+
+
+def test_cache_limitado_e_invalidado_por_modificacao(servico, tmp_path):
+    arquivo = str(tmp_path / "labirinto.txt")
+    shutil.copy(ARQUIVO_LABIRINTO, arquivo)
+
+    assert not servico.simular({'labirinto': arquivo, 'limite_passos': 500})['em_cache']
+    assert servico.simular({'labirinto': arquivo, 'limite_passos': 500})['em_cache']
+
+    # Arquivo modificado: a versão antiga sai do cache
+    os.utime(arquivo, ns=(0, 0))
+    assert not servico.simular({'labirinto': arquivo, 'limite_passos': 500})['em_cache']
+    assert len([c for c in servico.cache if c[0] == os.path.abspath(arquivo)]) == 1
+
+    servico.simular({'labirinto': arquivo, 'limite_passos': 400})
+    servico.simular({'labirinto': arquivo, 'limite_passos': 300})
+    assert len(servico.cache) == 2
+
+
+def test_labirintos_carregados_sao_limitados(tmp_path, monkeypatch):
+    monkeypatch.setattr(simulacao, '_labirintos', type(simulacao._labirintos)())
+    monkeypatch.setattr(simulacao, 'LIMITE_LABIRINTOS_EM_CACHE', 2)
+    arquivo = str(tmp_path / "labirinto.txt")
+    shutil.copy(ARQUIVO_LABIRINTO, arquivo)
+
+    simulacao.carregar_labirinto(arquivo)
+    os.utime(arquivo, ns=(0, 0))
+    simulacao.carregar_labirinto(arquivo)
+    assert list(simulacao._labirintos) == [os.path.abspath(arquivo)]
+
+    simulacao.carregar_labirinto(ARQUIVO_LABIRINTO)
+    shutil.copy(ARQUIVO_LABIRINTO, str(tmp_path / "outro.txt"))
+    simulacao.carregar_labirinto(str(tmp_path / "outro.txt"))
+    assert len(simulacao._labirintos) == 2
+
+
+def test_simular_usa_o_mesmo_ciclo_de_executar():
+    resultado = simulacao.simular(simulacao.carregar_labirinto(ARQUIVO_LABIRINTO), 'reativa', 1000)
+    assert resultado['concluido'] and resultado['comidas_coletadas'] == 4